@@ -419,10 +419,7 @@ async def get_system_status():
             "rlmai": {
                 "status": "operational",
                 "total_feedback": len(rlmai.feedback.feedback_log),
-                "active_training_jobs": sum(
-                    1 for job in rlmai.trainer.training_jobs.values()
-                    if job["status"] in ["PENDING", "TRAINING"]
-                )
+                "active_training_jobs": rlmai.trainer.active_jobs
             },
             "pdca": {
                 "status": "operational",
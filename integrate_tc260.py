@@ -17,7 +17,10 @@ if 'tc260' in app_content.lower():
 # Find the line where we should add the import
 import_section = """
 # TC260 Integration
-from tc260.engine import TC260Engine
+import logging
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+from tc260.engine import get_engine
 from tc260.schemas import VerificationRequest, VerificationReport
 """
 
@@ -28,8 +31,9 @@ tc260_routes = '''
 # TC260 SAFETY VERIFICATION ROUTES
 # ============================================================================
 
-# Initialize TC260 engine
-tc260_engine = TC260Engine()
+# Shared TC260 engine
+tc260_engine = get_engine()
+tc260_logger = logging.getLogger("tc260")
 
 @app.get("/api/v1/tc260")
 async def tc260_info():
@@ -47,10 +51,12 @@ async def tc260_info():
 async def verify_content(request: VerificationRequest):
     """Verify AI-generated content against TC260 safety standards"""
     try:
-        report = tc260_engine.verify(request)
-        return report
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Verification failed: {str(e)}")
+        report = await run_in_threadpool(tc260_engine.verify, request)
+        return Response(content=report.model_dump_json(), media_type="application/json")
+    except Exception:
+        # Log the details server-side; clients get a fixed message
+        tc260_logger.exception("TC260 verification failed")
+        raise HTTPException(status_code=500, detail="Verification failed")
 
 @app.get("/api/v1/tc260/categories")
 async def list_categories():
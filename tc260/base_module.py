@@ -6,15 +6,48 @@ All TC260 risk category modules inherit from this base class.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from array import array
+from collections import OrderedDict
+from functools import wraps
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import hashlib
+import threading
 import time
 from datetime import datetime
 import re
 
 # Import schemas (will be in same directory when deployed)
 
+from tc260.scanner import PatternScanner, SubstringSet
 from tc260.schemas import RiskAssessment, RiskFinding, RiskLevel
 
+# Severity levels in ascending order; findings are stored as indexes into this tuple
+_SEVERITY_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+_SEVERITY_INDEX = {level: i for i, level in enumerate(_SEVERITY_LEVELS)}
+
+
+def cached_analysis(analyze):
+    """
+    Decorator for a module's analyze() that reuses the assessment of
+    identical content (see TC260BaseModule._cache_key) for up to
+    cache_ttl_seconds, unless the module's cache_enabled is off.
+    
+    Findings are kept on the module instance, so analyses of one instance
+    are serialized; different modules still run concurrently. Cached
+    assessments are shared between callers and must not be mutated.
+    """
+    @wraps(analyze)
+    def wrapper(self, content: str, context: Optional[Dict[str, Any]] = None, **kwargs) -> RiskAssessment:
+        cache_key = self._cache_key(content)
+        cached = self._get_cached_assessment(cache_key)
+        if cached is not None:
+            return cached
+        with self._analysis_lock:
+            assessment = analyze(self, content, context, **kwargs)
+        self._cache_assessment(cache_key, assessment)
+        return assessment
+    return wrapper
+
 
 class TC260BaseModule(ABC):
     """
@@ -26,6 +59,30 @@ class TC260BaseModule(ABC):
     - _generate_recommendations(): Remediation suggestions
     """
     
+    # Assessment cache bounds. Short content is cheaper to rescan than to hash,
+    # and very large content is not worth keeping in memory.
+    CACHE_MAX_ENTRIES = 4096
+    CACHE_MIN_CONTENT_LENGTH = 64
+    CACHE_MAX_CONTENT_LENGTH = 1024 * 1024
+    
+    # Modules whose per-pattern checks can be scanned by the pipeline set this
+    # and accept a precomputed_hits argument in analyze()
+    SCANNER: Optional[PatternScanner] = None
+    
+    # Modules that only look for literal keywords in the lowercased content set
+    # this and accept a precomputed_keywords argument in analyze()
+    keyword_set: Optional[SubstringSet] = None
+    
+    # Initial capacity of the findings buffers; they double when full
+    FINDINGS_CAPACITY = 64
+    
+    # Measure processing_time_ms for each analysis (reported as 0 when off)
+    collect_timing: bool = True
+    
+    # Assessment cache settings; the engine sets them from TC260Config
+    cache_enabled: bool = True
+    cache_ttl_seconds: float = 3600
+    
     def __init__(self, category_id: str, category_name: str, threshold: float = 70.0):
         """
         Initialize the base module.
@@ -38,7 +95,11 @@ class TC260BaseModule(ABC):
         self.category_id = category_id
         self.category_name = category_name
         self.threshold = threshold
-        self.findings: List[RiskFinding] = []
+        self._allocate_findings(self.FINDINGS_CAPACITY)
+        # Assessment cache: key -> (expiry on the monotonic clock, assessment), in LRU order
+        self._assessment_cache: "OrderedDict[Tuple[bytes, float], Tuple[float, RiskAssessment]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._analysis_lock = threading.Lock()
         
     @abstractmethod
     def analyze(self, content: str, context: Optional[Dict[str, Any]] = None) -> RiskAssessment:
@@ -54,6 +115,25 @@ class TC260BaseModule(ABC):
         """
         pass
     
+    def analyze_many(self, contents: List[str], context: Optional[Dict[str, Any]] = None) -> List[RiskAssessment]:
+        """
+        Analyze a batch of contents with this module.
+        
+        Compiled patterns and lookup tables live on the class, so each
+        item only pays for its own scan.
+        
+        Args:
+            contents: AI-generated contents to analyze
+            context: Optional additional context shared by the batch
+        
+        Returns:
+            One RiskAssessment per content, in input order
+        """
+        assessments: List[Optional[RiskAssessment]] = [None] * len(contents)
+        for i, content in enumerate(contents):
+            assessments[i] = self.analyze(content, context)
+        return assessments
+    
     @abstractmethod
     def _calculate_risk_score(self, content: str, findings: List[RiskFinding]) -> float:
         """
@@ -126,7 +206,7 @@ class TC260BaseModule(ABC):
         recommendations = self._generate_recommendations(findings)
         passed = risk_score < self.threshold
         
-        return RiskAssessment(
+        return RiskAssessment.build_trusted(
             category_id=self.category_id,
             category_name=self.category_name,
             risk_score=risk_score,
@@ -146,7 +226,8 @@ class TC260BaseModule(ABC):
         severity: RiskLevel,
         location: Optional[str] = None,
         evidence: Optional[str] = None,
-        confidence: float = 0.85
+        confidence: float = 0.85,
+        tags: int = 0
     ):
         """
         Add a risk finding to the current analysis.
@@ -157,19 +238,132 @@ class TC260BaseModule(ABC):
             location: Where in the content this was found
             evidence: Supporting evidence
             confidence: Confidence in this finding (0-1)
+            tags: Module-defined flag bits, OR-ed into _finding_tags
         """
-        finding = RiskFinding(
-            description=description,
-            severity=severity,
-            location=location,
-            evidence=evidence,
-            confidence=confidence
+        i = self._finding_count
+        if i == len(self._finding_severities):
+            self._grow_findings()
+        self._finding_tags |= tags
+        self._finding_severities[i] = _SEVERITY_INDEX[severity]
+        self._finding_confidences[i] = confidence
+        self._finding_descriptions[i] = description
+        self._finding_locations[i] = location
+        self._finding_evidence[i] = evidence
+        self._finding_count = i + 1
+        self._findings_view = None
+    
+    @property
+    def findings(self) -> List[RiskFinding]:
+        """Findings of the current analysis, materialized on first access"""
+        if self._findings_view is None:
+            n = self._finding_count
+            self._findings_view = [
+                RiskFinding.build_trusted(
+                    description=description,
+                    severity=_SEVERITY_LEVELS[severity],
+                    location=location,
+                    evidence=evidence,
+                    confidence=confidence
+                )
+                for severity, confidence, description, location, evidence in zip(
+                    self._finding_severities[:n],
+                    self._finding_confidences[:n],
+                    self._finding_descriptions[:n],
+                    self._finding_locations[:n],
+                    self._finding_evidence[:n]
+                )
+            ]
+        return self._findings_view
+    
+    def _has_severity(self, severity: RiskLevel) -> bool:
+        """Check if any finding of the current analysis has the given severity"""
+        return _SEVERITY_INDEX[severity] in self._finding_severities[:self._finding_count]
+    
+    def _weighted_severity_score(self, severity_weights: Sequence[float]) -> float:
+        """
+        Average of severity weight x confidence over the current analysis' findings.
+        
+        Args:
+            severity_weights: Weights for LOW, MEDIUM, HIGH and CRITICAL, in that order
+            
+        Returns:
+            Weighted average (0.0 when there are no findings)
+        """
+        count = self._finding_count
+        if not count:
+            return 0.0
+        total_score = sum(
+            severity_weights[severity] * confidence
+            for severity, confidence in zip(self._finding_severities[:count], self._finding_confidences[:count])
         )
-        self.findings.append(finding)
+        return total_score / count
+    
+    def _cache_key(self, content: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Build the assessment cache key for content.
+        
+        Returns:
+            (content digest, threshold) or None if content should not be cached
+        """
+        if not self.cache_enabled:
+            return None
+        if not self.CACHE_MIN_CONTENT_LENGTH <= len(content) <= self.CACHE_MAX_CONTENT_LENGTH:
+            return None
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return (digest, self.threshold)
+    
+    def _get_cached_assessment(self, key: Optional[Tuple[bytes, float]]) -> Optional[RiskAssessment]:
+        """Return an unexpired assessment for key, if any"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            entry = self._assessment_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, assessment = entry
+            if time.monotonic() >= expires_at:
+                del self._assessment_cache[key]
+                return None
+            self._assessment_cache.move_to_end(key)
+            return assessment
+    
+    def _cache_assessment(self, key: Optional[Tuple[bytes, float]], assessment: RiskAssessment):
+        """Store an assessment, evicting the least recently used entry when full"""
+        if key is None:
+            return
+        expires_at = time.monotonic() + self.cache_ttl_seconds
+        with self._cache_lock:
+            self._assessment_cache[key] = (expires_at, assessment)
+            self._assessment_cache.move_to_end(key)
+            if len(self._assessment_cache) > self.CACHE_MAX_ENTRIES:
+                self._assessment_cache.popitem(last=False)
+    
+    def _allocate_findings(self, capacity: int):
+        """Allocate empty findings buffers with room for capacity findings"""
+        # Findings are kept as parallel arrays and only turned into
+        # RiskFinding objects when the findings property is read
+        self._finding_severities = array('B', bytes(capacity))
+        self._finding_confidences = array('d', [0.0]) * capacity
+        self._finding_descriptions: List[Optional[str]] = [None] * capacity
+        self._finding_locations: List[Optional[str]] = [None] * capacity
+        self._finding_evidence: List[Optional[str]] = [None] * capacity
+        self._reset_findings()
+    
+    def _grow_findings(self):
+        """Double the capacity of the findings buffers, keeping recorded findings"""
+        extra = len(self._finding_severities)
+        self._finding_severities.extend(bytes(extra))
+        self._finding_confidences.extend(array('d', [0.0]) * extra)
+        self._finding_descriptions.extend([None] * extra)
+        self._finding_locations.extend([None] * extra)
+        self._finding_evidence.extend([None] * extra)
     
     def _reset_findings(self):
         """Clear all findings (called at start of each analysis)"""
-        self.findings = []
+        # The buffers are reused across analyses; only the cursor is rewound
+        self._finding_count = 0
+        self._findings_view: Optional[List[RiskFinding]] = None
+        self._finding_tags = 0
     
     # Utility methods for common pattern matching
     
@@ -186,3 +380,10 @@ class TC260BaseModule(ABC):
     def _count_occurrences(self, content: str, pattern: str, case_sensitive: bool = False) -> int:
         """Count occurrences of a pattern"""
         return len(self._extract_matches(content, pattern, case_sensitive))
+    
+    def _match_value(self, match: re.Match) -> Any:
+        """The item re.findall() would return for match (whole match, group, or tuple of groups)"""
+        groups = match.groups('')
+        if not groups:
+            return match.group(0)
+        return groups[0] if len(groups) == 1 else groups
@@ -5,11 +5,16 @@ Council of AI - EU260 Safety Verification Platform
 Orchestrates all 32 TC260 risk category modules for comprehensive AI safety verification.
 """
 
+import hashlib
+import threading
 import time
 import uuid
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from tc260.scanner import SharedScanner, SubstringSet, lowercase
 from tc260.schemas import (
     VerificationRequest,
     VerificationReport,
@@ -94,18 +99,63 @@ class TC260Engine:
         'TC260-32': HumanOversightModule,
     }
     
+    # Bounds of the report cache (used when config.enable_caching is set)
+    REPORT_CACHE_MAX_ENTRIES = 1024
+    REPORT_CACHE_MAX_CONTENT_LENGTH = 1024 * 1024
+    
     def __init__(self, config: Optional[TC260Config] = None):
         """Initialize TC260 engine with all 32 modules"""
         self.config = config or TC260Config()
         self.modules: Dict[str, Any] = {}
         self._initialize_modules()
+        
+        # Module metadata does not change after initialization
+        self._module_info = self._build_module_info()
+        
+        # Report cache: key -> (expiry on the monotonic clock, report), in LRU order
+        self._report_cache: "OrderedDict[Tuple, Tuple[float, VerificationReport]]" = OrderedDict()
+        self._report_cache_lock = threading.Lock()
+        
+        # One worker pool for the engine's lifetime instead of one per request
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix="tc260"
+        ) if self.config.parallel_processing else None
+    
+    def shutdown(self):
+        """Stop the engine's worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     def _initialize_modules(self):
         """Load all enabled modules"""
         for category_id in self.config.enabled_categories:
             if category_id in self.MODULE_REGISTRY:
                 module_class = self.MODULE_REGISTRY[category_id]
-                self.modules[category_id] = module_class(self.config.default_threshold)
+                module = module_class(self.config.default_threshold)
+                module.collect_timing = self.config.collect_timing
+                module.cache_enabled = self.config.enable_caching
+                module.cache_ttl_seconds = self.config.cache_ttl_seconds
+                self.modules[category_id] = module
+        
+        # Modules with a pattern scanner share a single gating pass per request
+        self.scanners = {
+            category_id: module.SCANNER
+            for category_id, module in self.modules.items()
+            if module.SCANNER is not None
+        }
+        self.shared_scanner = SharedScanner(self.scanners) if len(self.scanners) > 1 else None
+        
+        # Keyword modules share one lowercasing and one check per distinct keyword
+        self.keyword_sets = {
+            category_id: module.keyword_set
+            for category_id, module in self.modules.items()
+            if module.keyword_set is not None
+        }
+        self.shared_keywords = SubstringSet(list(dict.fromkeys(
+            keyword for keyword_set in self.keyword_sets.values() for keyword in keyword_set.keywords
+        ))) if len(self.keyword_sets) > 1 else None
     
     def verify(self, request: VerificationRequest) -> VerificationReport:
         """
@@ -120,14 +170,28 @@ class TC260Engine:
         start_time = time.time()
         request_id = str(uuid.uuid4())
         
+        # Identical requests get the cached result under a new request ID
+        cache_key = self._report_cache_key(request)
+        cached = self._get_cached_report(cache_key)
+        if cached is not None:
+            return cached.model_copy(update={
+                "request_id": request_id,
+                "risk_assessments": list(cached.risk_assessments),
+                "timestamp": datetime.utcnow(),
+                "processing_time_ms": int((time.time() - start_time) * 1000)
+            })
+        
         # Determine which categories to test
         categories_to_test = request.categories or list(self.modules.keys())
         
+        # Scan once for all modules that share pattern or keyword scanning
+        shared_results = self._shared_scan(request.content, categories_to_test)
+        
         # Run verification (parallel or sequential)
-        if self.config.parallel_processing:
-            assessments = self._verify_parallel(request.content, categories_to_test, request.context)
+        if self._executor is not None:
+            assessments = self._verify_parallel(request.content, categories_to_test, request.context, shared_results)
         else:
-            assessments = self._verify_sequential(request.content, categories_to_test, request.context)
+            assessments = self._verify_sequential(request.content, categories_to_test, request.context, shared_results)
         
         # Calculate overall metrics
         overall_score = sum(a.risk_score for a in assessments) / len(assessments) if assessments else 0.0
@@ -146,7 +210,7 @@ class TC260Engine:
         
         processing_time_ms = int((time.time() - start_time) * 1000)
         
-        return VerificationReport(
+        report = VerificationReport.build_trusted(
             request_id=request_id,
             overall_score=overall_score,
             overall_status=overall_status,
@@ -157,35 +221,120 @@ class TC260Engine:
             risk_assessments=assessments,
             processing_time_ms=processing_time_ms
         )
+        self._cache_report(cache_key, report)
+        return report
+    
+    def _report_cache_key(self, request: VerificationRequest) -> Optional[Tuple]:
+        """
+        Build the report cache key for a request.
+        
+        Like the modules' assessment caches, the key does not include the
+        request context, which modules do not use.
+        
+        Returns:
+            (content digest, categories, threshold) or None if the report should not be cached
+        """
+        if not self.config.enable_caching or len(request.content) > self.REPORT_CACHE_MAX_CONTENT_LENGTH:
+            return None
+        digest = hashlib.blake2b(request.content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        categories = tuple(request.categories) if request.categories else None
+        return (digest, categories, request.threshold)
+    
+    def _get_cached_report(self, key: Optional[Tuple]) -> Optional[VerificationReport]:
+        """Return an unexpired report for key, if any"""
+        if key is None:
+            return None
+        with self._report_cache_lock:
+            entry = self._report_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, report = entry
+            if time.monotonic() >= expires_at:
+                del self._report_cache[key]
+                return None
+            self._report_cache.move_to_end(key)
+            return report
     
-    def _verify_parallel(self, content: str, categories: List[str], context: Optional[Dict[str, Any]]) -> List[RiskAssessment]:
+    def _cache_report(self, key: Optional[Tuple], report: VerificationReport):
+        """Store a report, evicting the least recently used entry when full"""
+        if key is None:
+            return
+        expires_at = time.monotonic() + self.config.cache_ttl_seconds
+        with self._report_cache_lock:
+            self._report_cache[key] = (expires_at, report)
+            self._report_cache.move_to_end(key)
+            if len(self._report_cache) > self.REPORT_CACHE_MAX_ENTRIES:
+                self._report_cache.popitem(last=False)
+    
+    def _shared_scan(self, content: str, categories: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the shared scanners that at least two requested modules use.
+        
+        Returns:
+            Category ID -> extra keyword arguments for that module's analyze()
+        """
+        shared_results: Dict[str, Dict[str, Any]] = {}
+        
+        if self.shared_scanner is not None and sum(1 for cat in categories if cat in self.scanners) >= 2:
+            for category_id, hits in self.shared_scanner.scan(content).items():
+                shared_results[category_id] = {'precomputed_hits': hits}
+        
+        if self.shared_keywords is not None and sum(1 for cat in categories if cat in self.keyword_sets) >= 2:
+            present = self.shared_keywords.find_present(lowercase(content))
+            for category_id in self.keyword_sets:
+                shared_results[category_id] = {'precomputed_keywords': present}
+        
+        return shared_results
+    
+    def _analyze_module(
+        self,
+        category: str,
+        content: str,
+        context: Optional[Dict[str, Any]],
+        shared_results: Dict[str, Dict[str, Any]]
+    ) -> RiskAssessment:
+        """Run one module, handing it the shared scan result if it has one"""
+        return self.modules[category].analyze(content, context, **shared_results.get(category, {}))
+    
+    def _verify_parallel(
+        self,
+        content: str,
+        categories: List[str],
+        context: Optional[Dict[str, Any]],
+        shared_results: Dict[str, Dict[str, Any]]
+    ) -> List[RiskAssessment]:
         """Run verification in parallel using thread pool"""
         assessments = []
         
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_category = {
-                executor.submit(self.modules[cat].analyze, content, context): cat
-                for cat in categories if cat in self.modules
-            }
-            
-            for future in as_completed(future_to_category):
-                try:
-                    assessment = future.result(timeout=self.config.timeout_seconds)
-                    assessments.append(assessment)
-                except Exception as e:
-                    category = future_to_category[future]
-                    print(f"Error in {category}: {e}")
+        future_to_category = {
+            self._executor.submit(self._analyze_module, cat, content, context, shared_results): cat
+            for cat in categories if cat in self.modules
+        }
+        
+        for future in as_completed(future_to_category):
+            try:
+                assessment = future.result(timeout=self.config.timeout_seconds)
+                assessments.append(assessment)
+            except Exception as e:
+                category = future_to_category[future]
+                print(f"Error in {category}: {e}")
         
         return sorted(assessments, key=lambda x: x.category_id)
     
-    def _verify_sequential(self, content: str, categories: List[str], context: Optional[Dict[str, Any]]) -> List[RiskAssessment]:
+    def _verify_sequential(
+        self,
+        content: str,
+        categories: List[str],
+        context: Optional[Dict[str, Any]],
+        shared_results: Dict[str, Dict[str, Any]]
+    ) -> List[RiskAssessment]:
         """Run verification sequentially"""
         assessments = []
         
         for category in categories:
             if category in self.modules:
                 try:
-                    assessment = self.modules[category].analyze(content, context)
+                    assessment = self._analyze_module(category, content, context, shared_results)
                     assessments.append(assessment)
                 except Exception as e:
                     print(f"Error in {category}: {e}")
@@ -193,7 +342,15 @@ class TC260Engine:
         return assessments
     
     def get_module_info(self) -> Dict[str, Any]:
-        """Get information about loaded modules"""
+        """
+        Get information about loaded modules.
+        
+        The same dict is returned on every call and must not be modified.
+        """
+        return self._module_info
+    
+    def _build_module_info(self) -> Dict[str, Any]:
+        """Build the module information returned by get_module_info"""
         return {
             "total_modules": len(self.MODULE_REGISTRY),
             "loaded_modules": len(self.modules),
@@ -206,3 +363,22 @@ class TC260Engine:
                 for cat_id, module in self.modules.items()
             }
         }
+
+
+_engine: Optional[TC260Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> TC260Engine:
+    """
+    Get the process-wide TC260Engine with the default configuration.
+    
+    Route modules share this instance instead of each building their own
+    set of modules, scanners and worker threads.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = TC260Engine()
+    return _engine
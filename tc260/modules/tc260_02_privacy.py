@@ -13,7 +13,8 @@ import time
 import re
 from typing import List, Dict, Any, Optional
 
-from tc260.base_module import TC260BaseModule
+from tc260.base_module import TC260BaseModule, cached_analysis
+from tc260.scanner import PatternScanner, GroupHits, lowercase
 from tc260.schemas import RiskFinding, RiskLevel, RiskAssessment
 
 
@@ -48,6 +49,30 @@ class PrivacyViolationModule(TC260BaseModule):
         r'\bsell.*(?:personal|user)\s+(?:data|information)\b',
     ]
     
+    # GDPR/CCPA user rights restrictions
+    GDPR_VIOLATIONS = [
+        r'\bno\s+(?:right\s+to|option\s+to)\s+(?:delete|remove|erase)\b',
+        r'\bcannot\s+(?:access|view|download)\s+(?:your|their)\s+(?:data|information)\b',
+        r'\bpermanent.*(?:data|information).*(?:retention|storage)\b'
+    ]
+    
+    # Score weight per finding severity: LOW, MEDIUM, HIGH, CRITICAL
+    SEVERITY_WEIGHTS = (15.0, 40.0, 70.0, 95.0)
+    
+    # Compiled once per class and shared by every analyze() call
+    _PII_RES = {pii_type: re.compile(p, re.IGNORECASE) for pii_type, p in PII_PATTERNS.items()}
+    
+    # First match of every PII pattern, gated by a union scan. Kept apart from
+    # SCANNER: PII patterns start with character classes, which would stop
+    # the shared union from skipping ahead on first characters.
+    _PII_SCANNER = PatternScanner({'pii': tuple(_PII_RES.values())})
+    
+    # First match of every violation pattern, gated by a single union scan
+    SCANNER = PatternScanner({
+        'privacy_violations': tuple(re.compile(p, re.IGNORECASE) for p in PRIVACY_VIOLATIONS),
+        'gdpr': tuple(re.compile(p, re.IGNORECASE) for p in GDPR_VIOLATIONS),
+    })
+    
     def __init__(self, threshold: float = 70.0):
         super().__init__(
             category_id="TC260-02",
@@ -55,17 +80,33 @@ class PrivacyViolationModule(TC260BaseModule):
             threshold=threshold
         )
     
-    def analyze(self, content: str, context: Optional[Dict[str, Any]] = None) -> RiskAssessment:
-        """Analyze content for privacy violations"""
-        start_time = time.time()
+    @cached_analysis
+    def analyze(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+        precomputed_hits: Optional[GroupHits] = None
+    ) -> RiskAssessment:
+        """
+        Analyze content for privacy violations.
+        
+        Args:
+            content: AI-generated content to analyze
+            context: Optional additional context
+            precomputed_hits: Result of SCANNER for this content, when the
+                pipeline already scanned it (see tc260.scanner.SharedScanner)
+        """
+        start_ns = time.perf_counter_ns() if self.collect_timing else 0
         self._reset_findings()
         
-        content_lower = content.lower()
+        content_lower = lowercase(content)
+        hits = precomputed_hits if precomputed_hits is not None else self.SCANNER.scan(content)
         pii_count = 0
         
-        # Detect PII
-        for pii_type, pattern in self.PII_PATTERNS.items():
-            matches = self._extract_matches(content, pattern)
+        # Detect PII (all occurrences are counted, starting from the first one)
+        pii_hits = self._PII_SCANNER.scan(content)['pii']
+        for (pii_type, pattern), first in zip(self._PII_RES.items(), pii_hits):
+            matches = pattern.findall(content, first.start()) if first else []
             if matches:
                 pii_count += len(matches)
                 severity = RiskLevel.CRITICAL if pii_type in ['ssn', 'credit_card', 'passport'] else RiskLevel.HIGH
@@ -91,33 +132,26 @@ class PrivacyViolationModule(TC260BaseModule):
                 )
         
         # Check for privacy violation patterns
-        for pattern in self.PRIVACY_VIOLATIONS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['privacy_violations']:
+            if match:
                 self._add_finding(
                     description="Privacy violation language detected: unauthorized data collection/sharing",
                     severity=RiskLevel.CRITICAL,
-                    evidence=str(matches[0]) if matches else None,
+                    evidence=str(self._match_value(match)),
                     confidence=0.85
                 )
         
         # Check for GDPR/CCPA violations
-        gdpr_violations = [
-            r'\bno\s+(?:right\s+to|option\s+to)\s+(?:delete|remove|erase)\b',
-            r'\bcannot\s+(?:access|view|download)\s+(?:your|their)\s+(?:data|information)\b',
-            r'\bpermanent.*(?:data|information).*(?:retention|storage)\b'
-        ]
-        for pattern in gdpr_violations:
-            if self._contains_pattern(content, pattern):
-                matches = self._extract_matches(content, pattern)
+        for match in hits['gdpr']:
+            if match:
                 self._add_finding(
                     description="Potential GDPR/CCPA violation: user rights restriction",
                     severity=RiskLevel.HIGH,
-                    evidence=str(matches[0]) if matches else None,
+                    evidence=str(self._match_value(match)),
                     confidence=0.80
                 )
         
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000 if self.collect_timing else 0
         
         return self._create_assessment(
             content=content,
@@ -144,21 +178,23 @@ class PrivacyViolationModule(TC260BaseModule):
         if not findings:
             return 0.0
         
-        severity_weights = {
-            RiskLevel.LOW: 15,
-            RiskLevel.MEDIUM: 40,
-            RiskLevel.HIGH: 70,
-            RiskLevel.CRITICAL: 95
-        }
-        
-        # PII exposure is weighted heavily
-        pii_findings = [f for f in findings if 'PII detected' in f.description]
-        violation_findings = [f for f in findings if 'violation' in f.description.lower()]
-        
-        pii_score = sum(severity_weights[f.severity] * f.confidence for f in pii_findings)
-        violation_score = sum(severity_weights[f.severity] * f.confidence for f in violation_findings)
-        other_score = sum(severity_weights[f.severity] * f.confidence for f in findings 
-                         if f not in pii_findings and f not in violation_findings)
+        # PII exposure is weighted heavily; findings are bucketed in one pass
+        pii_score = violation_score = other_score = 0.0
+        count = self._finding_count
+        for severity, confidence, description in zip(
+            self._finding_severities[:count],
+            self._finding_confidences[:count],
+            self._finding_descriptions[:count]
+        ):
+            score = self.SEVERITY_WEIGHTS[severity] * confidence
+            is_pii = 'PII detected' in description
+            is_violation = 'violation' in description.lower()
+            if is_pii:
+                pii_score += score
+            if is_violation:
+                violation_score += score
+            if not is_pii and not is_violation:
+                other_score += score
         
         # Weight PII and violations more heavily
         total_score = (pii_score * 1.5 + violation_score * 1.3 + other_score) / max(len(findings), 1)
@@ -13,12 +13,25 @@ Detects content that could cause harm:
 
 import time
 import re
+from enum import IntFlag
 from typing import List, Dict, Any, Optional
 
-from tc260.base_module import TC260BaseModule
+from tc260.base_module import TC260BaseModule, cached_analysis
+from tc260.scanner import PatternScanner, GroupHits, SubstringSet, lowercase
 from tc260.schemas import RiskFinding, RiskLevel, RiskAssessment
 
 
+class HarmTag(IntFlag):
+    """Finding tags used to select recommendations"""
+    VIOLENT = 1
+    SELF_HARM = 2
+    HATE = 4
+    DANGEROUS = 8
+    CHILD = 16
+    SEXUAL = 32
+    EXTREMIST = 64
+
+
 class HarmfulContentModule(TC260BaseModule):
     """Detects harmful content"""
     
@@ -75,6 +88,33 @@ class HarmfulContentModule(TC260BaseModule):
         r'\b(?:isis|al-qaeda|taliban)\s+(?:recruitment|propaganda)\b',
     ]
     
+    # Graphic description keywords
+    GRAPHIC_KEYWORDS = ['blood', 'gore', 'corpse', 'mutilated', 'dismembered', 'decapitated']
+    _GRAPHIC_KEYWORDS = SubstringSet(GRAPHIC_KEYWORDS)
+    
+    # Score weight per finding severity: LOW, MEDIUM, HIGH, CRITICAL
+    SEVERITY_WEIGHTS = (20.0, 45.0, 75.0, 95.0)
+    
+    # Compiled once per class and shared by every analyze() call
+    _VIOLENCE_RES = tuple(re.compile(p, re.IGNORECASE) for p in VIOLENCE_PATTERNS)
+    _SELF_HARM_RES = tuple(re.compile(p, re.IGNORECASE) for p in SELF_HARM_PATTERNS)
+    _HATE_SPEECH_RES = tuple(re.compile(p, re.IGNORECASE) for p in HATE_SPEECH_PATTERNS)
+    _DANGEROUS_RES = tuple(re.compile(p, re.IGNORECASE) for p in DANGEROUS_INSTRUCTIONS)
+    _CHILD_SAFETY_RES = tuple(re.compile(p, re.IGNORECASE) for p in CHILD_SAFETY_PATTERNS)
+    _SEXUAL_CONTENT_RES = tuple(re.compile(p, re.IGNORECASE) for p in SEXUAL_CONTENT_PATTERNS)
+    _EXTREMISM_RES = tuple(re.compile(p, re.IGNORECASE) for p in EXTREMISM_PATTERNS)
+    
+    # First match of every pattern above, gated by a single union scan
+    SCANNER = PatternScanner({
+        'violence': _VIOLENCE_RES,
+        'self_harm': _SELF_HARM_RES,
+        'hate_speech': _HATE_SPEECH_RES,
+        'dangerous': _DANGEROUS_RES,
+        'child_safety': _CHILD_SAFETY_RES,
+        'sexual_content': _SEXUAL_CONTENT_RES,
+        'extremism': _EXTREMISM_RES,
+    })
+    
     def __init__(self, threshold: float = 70.0):
         super().__init__(
             category_id="TC260-04",
@@ -82,103 +122,119 @@ class HarmfulContentModule(TC260BaseModule):
             threshold=threshold
         )
     
-    def analyze(self, content: str, context: Optional[Dict[str, Any]] = None) -> RiskAssessment:
-        """Analyze content for harmful material"""
-        start_time = time.time()
+    @cached_analysis
+    def analyze(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+        precomputed_hits: Optional[GroupHits] = None
+    ) -> RiskAssessment:
+        """
+        Analyze content for harmful material.
+        
+        Args:
+            content: AI-generated content to analyze
+            context: Optional additional context
+            precomputed_hits: Result of SCANNER for this content, when the
+                pipeline already scanned it (see tc260.scanner.SharedScanner)
+        """
+        start_ns = time.perf_counter_ns() if self.collect_timing else 0
         self._reset_findings()
         
-        content_lower = content.lower()
+        content_lower = lowercase(content)
+        hits = precomputed_hits if precomputed_hits is not None else self.SCANNER.scan(content)
         
         # Check for violence
-        for pattern in self.VIOLENCE_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['violence']:
+            if match:
                 self._add_finding(
                     description="Violent content detected: instructions or descriptions of violence",
                     severity=RiskLevel.CRITICAL,
                     evidence="[REDACTED - violent content]",
-                    confidence=0.90
+                    confidence=0.90,
+                    tags=HarmTag.VIOLENT
                 )
         
         # Check for self-harm
-        for pattern in self.SELF_HARM_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['self_harm']:
+            if match:
                 self._add_finding(
                     description="Self-harm content detected: suicide or self-injury instructions",
                     severity=RiskLevel.CRITICAL,
                     evidence="[REDACTED - self-harm content]",
-                    confidence=0.95
+                    confidence=0.95,
+                    tags=HarmTag.SELF_HARM
                 )
         
         # Check for hate speech
-        for pattern in self.HATE_SPEECH_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['hate_speech']:
+            if match:
                 self._add_finding(
                     description="Hate speech detected: content targeting protected groups",
                     severity=RiskLevel.CRITICAL,
                     evidence="[REDACTED - hate speech]",
-                    confidence=0.92
+                    confidence=0.92,
+                    tags=HarmTag.HATE
                 )
         
         # Check for dangerous instructions
-        for pattern in self.DANGEROUS_INSTRUCTIONS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['dangerous']:
+            if match:
                 self._add_finding(
                     description="Dangerous instructions detected: illegal or harmful activities",
                     severity=RiskLevel.HIGH,
-                    evidence=str(matches[0]) if matches else None,
-                    confidence=0.85
+                    evidence=match.group(0),
+                    confidence=0.85,
+                    tags=HarmTag.DANGEROUS
                 )
         
         # Check for child safety violations
-        for pattern in self.CHILD_SAFETY_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['child_safety']:
+            if match:
                 self._add_finding(
                     description="⚠️ CHILD SAFETY VIOLATION: Content involving minors",
                     severity=RiskLevel.CRITICAL,
                     evidence="[REDACTED - child safety violation]",
-                    confidence=0.98
+                    confidence=0.98,
+                    tags=HarmTag.CHILD
                 )
         
         # Check for sexual content
-        for pattern in self.SEXUAL_CONTENT_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
-                severity = RiskLevel.CRITICAL if 'rape' in matches[0].lower() or 'assault' in matches[0].lower() else RiskLevel.HIGH
+        for match in hits['sexual_content']:
+            if match:
+                matched = match.group(0).lower()
+                severity = RiskLevel.CRITICAL if 'rape' in matched or 'assault' in matched else RiskLevel.HIGH
                 self._add_finding(
                     description="Sexual content detected",
                     severity=severity,
                     evidence="[REDACTED - sexual content]",
-                    confidence=0.88
+                    confidence=0.88,
+                    tags=HarmTag.SEXUAL
                 )
         
         # Check for extremism
-        for pattern in self.EXTREMISM_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
+        for match in hits['extremism']:
+            if match:
                 self._add_finding(
                     description="Extremist content detected: terrorism or radicalization material",
                     severity=RiskLevel.CRITICAL,
                     evidence="[REDACTED - extremist content]",
-                    confidence=0.93
+                    confidence=0.93,
+                    tags=HarmTag.EXTREMIST
                 )
         
         # Check for graphic descriptions
-        graphic_keywords = ['blood', 'gore', 'corpse', 'mutilated', 'dismembered', 'decapitated']
-        graphic_count = sum(1 for keyword in graphic_keywords if keyword in content_lower)
+        graphic_count = self._GRAPHIC_KEYWORDS.count_present(content_lower)
         if graphic_count >= 2:
             self._add_finding(
                 description=f"Graphic violent imagery described ({graphic_count} indicators)",
                 severity=RiskLevel.HIGH,
                 evidence=f"{graphic_count} graphic terms detected",
-                confidence=0.75
+                confidence=0.75,
+                tags=HarmTag.VIOLENT
             )
         
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000 if self.collect_timing else 0
         
         return self._create_assessment(
             content=content,
@@ -194,19 +250,10 @@ class HarmfulContentModule(TC260BaseModule):
             return 0.0
         
         # Harmful content gets maximum severity
-        critical_findings = [f for f in findings if f.severity == RiskLevel.CRITICAL]
-        if critical_findings:
+        if self._has_severity(RiskLevel.CRITICAL):
             return 95.0  # Automatic high score for critical harmful content
         
-        severity_weights = {
-            RiskLevel.LOW: 20,
-            RiskLevel.MEDIUM: 45,
-            RiskLevel.HIGH: 75,
-            RiskLevel.CRITICAL: 95
-        }
-        
-        total_score = sum(severity_weights[f.severity] * f.confidence for f in findings)
-        risk_score = total_score / max(len(findings), 1)
+        risk_score = self._weighted_severity_score(self.SEVERITY_WEIGHTS)
         
         return min(risk_score, 100.0)
     
@@ -216,31 +263,32 @@ class HarmfulContentModule(TC260BaseModule):
             return ["No harmful content detected. Content appears safe."]
         
         recommendations = []
+        tags = self._finding_tags
         
         # Critical recommendations
-        if any(f.severity == RiskLevel.CRITICAL for f in findings):
+        if self._has_severity(RiskLevel.CRITICAL):
             recommendations.append("⚠️ IMMEDIATE ACTION REQUIRED: Remove all harmful content immediately")
             recommendations.append("This content may violate laws and platform policies")
             recommendations.append("Do not deploy or distribute this content under any circumstances")
         
         # Specific recommendations by category
-        if any('self-harm' in f.description.lower() or 'suicide' in f.description.lower() for f in findings):
+        if tags & HarmTag.SELF_HARM:
             recommendations.append("Include crisis helpline resources (e.g., 988 Suicide & Crisis Lifeline)")
             recommendations.append("Remove instructions or encouragement of self-harm")
         
-        if any('child safety' in f.description.lower() for f in findings):
+        if tags & HarmTag.CHILD:
             recommendations.append("⚠️ LEGAL VIOLATION: Report to NCMEC and law enforcement immediately")
             recommendations.append("Preserve evidence and cooperate with authorities")
         
-        if any('hate speech' in f.description.lower() for f in findings):
+        if tags & HarmTag.HATE:
             recommendations.append("Remove all hate speech and discriminatory content")
             recommendations.append("Review content moderation policies")
         
-        if any('violent' in f.description.lower() for f in findings):
+        if tags & HarmTag.VIOLENT:
             recommendations.append("Remove graphic violence and dangerous instructions")
             recommendations.append("Add content warnings if violence is contextually necessary")
         
-        if any('extremist' in f.description.lower() or 'terrorism' in f.description.lower() for f in findings):
+        if tags & HarmTag.EXTREMIST:
             recommendations.append("Report extremist content to appropriate authorities")
             recommendations.append("Remove radicalization and recruitment material")
         
@@ -14,7 +14,8 @@ import time
 import re
 from typing import List, Dict, Any, Optional
 
-from tc260.base_module import TC260BaseModule
+from tc260.base_module import TC260BaseModule, cached_analysis
+from tc260.scanner import PatternScanner, SubstringSet, compile_alternation, lowercase
 from tc260.schemas import RiskFinding, RiskLevel, RiskAssessment
 
 
@@ -76,6 +77,35 @@ class IntellectualPropertyModule(TC260BaseModule):
         r'(?:page|p\.)\s+\d+',  # Page references
     ]
     
+    # Trade secret language
+    TRADE_SECRET_PATTERNS = [
+        r'\bconfidential.*information\b',
+        r'\btrade secret\b',
+        r'\bproprietary.*(?:information|data|technology)\b',
+        r'\bnon-disclosure\b',
+    ]
+    
+    # Score weight per finding severity: LOW, MEDIUM, HIGH, CRITICAL
+    SEVERITY_WEIGHTS = (15.0, 40.0, 70.0, 90.0)
+    
+    # Compiled once per class and shared by every analyze() call
+    # Each family is fused into one alternation and scanned once; copyright
+    # notices keep a named group per pattern so matches can be grouped back
+    _COPYRIGHT_RE = re.compile(
+        '|'.join(f'(?P<c{i}>{p})' for i, p in enumerate(COPYRIGHT_PATTERNS)), re.IGNORECASE
+    )
+    _ATTRIBUTION_RE = compile_alternation(ATTRIBUTION_PATTERNS, re.IGNORECASE)
+    _LICENSE_RE = compile_alternation(LICENSE_PATTERNS, re.IGNORECASE)
+    _TRADE_SECRET_RES = tuple(re.compile(p, re.IGNORECASE) for p in TRADE_SECRET_PATTERNS)
+    _TRADE_SECRET_SCANNER = PatternScanner({'trade_secret': _TRADE_SECRET_RES})
+    # Trademark symbols have no case variants, so they are counted with str.count
+    TRADEMARK_SYMBOLS = ('™', '®')
+    _CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```', re.IGNORECASE)
+    _LONG_QUOTE_RE = re.compile(r'"[^"]{100,}"', re.IGNORECASE)
+    # Book structure: chapter/section or page references
+    _STRUCTURE_RE = re.compile(r'(?:chapter|section)\s+\d+|(?:page|p\.)\s+\d+', re.IGNORECASE)
+    _COPYRIGHTED_PHRASES = SubstringSet(COPYRIGHTED_PHRASES)
+    
     def __init__(self, threshold: float = 70.0):
         super().__init__(
             category_id="TC260-05",
@@ -83,31 +113,41 @@ class IntellectualPropertyModule(TC260BaseModule):
             threshold=threshold
         )
     
+    @cached_analysis
     def analyze(self, content: str, context: Optional[Dict[str, Any]] = None) -> RiskAssessment:
         """Analyze content for IP violations"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns() if self.collect_timing else 0
         self._reset_findings()
         
-        content_lower = content.lower()
+        # Content-wide attribution and license checks, reused by the checks below
+        has_attribution = self._ATTRIBUTION_RE.search(content) is not None
+        has_license = self._LICENSE_RE.search(content) is not None
         
         # Check for copyright notices (indicates potential copying)
-        copyright_matches = []
-        for pattern in self.COPYRIGHT_PATTERNS:
-            matches = self._extract_matches(content, pattern)
-            if matches:
-                copyright_matches.extend(matches)
+        # Only the count and the first notice of the first matching pattern are
+        # reported, so matches are not collected
+        copyright_count = 0
+        first_notice = None
+        first_pattern = len(self.COPYRIGHT_PATTERNS)
+        for match in self._COPYRIGHT_RE.finditer(content):
+            copyright_count += 1
+            pattern_index = int(match.lastgroup[1:])
+            if pattern_index < first_pattern:
+                first_pattern = pattern_index
+                first_notice = match.group(0)
         
-        if copyright_matches:
+        if copyright_count:
             self._add_finding(
                 description="Copyright notice detected in content (may indicate copied material)",
                 severity=RiskLevel.HIGH,
-                evidence=copyright_matches[0],
+                evidence=first_notice,
                 confidence=0.80
             )
         
         # Check for well-known copyrighted phrases
+        present_phrases = self._COPYRIGHTED_PHRASES.find_present(lowercase(content))
         for phrase in self.COPYRIGHTED_PHRASES:
-            if phrase in content_lower:
+            if phrase in present_phrases:
                 self._add_finding(
                     description=f"Well-known copyrighted phrase detected: '{phrase}'",
                     severity=RiskLevel.MEDIUM,
@@ -116,27 +156,23 @@ class IntellectualPropertyModule(TC260BaseModule):
                 )
         
         # Check for trademark symbols
-        trademark_matches = self._extract_matches(content, r'[™®]')
-        if trademark_matches:
+        trademark_count = sum(content.count(symbol) for symbol in self.TRADEMARK_SYMBOLS)
+        if trademark_count:
             self._add_finding(
-                description=f"Trademark symbols detected ({len(trademark_matches)} occurrences)",
+                description=f"Trademark symbols detected ({trademark_count} occurrences)",
                 severity=RiskLevel.MEDIUM,
-                evidence=f"{len(trademark_matches)} trademark symbols found",
+                evidence=f"{trademark_count} trademark symbols found",
                 confidence=0.75
             )
         
         # Check for code blocks
-        code_blocks = self._extract_matches(content, r'```[\s\S]*?```')
+        code_blocks = self._CODE_BLOCK_RE.findall(content)
         if code_blocks:
             # Check if code has attribution or license
-            has_attribution = any(self._contains_pattern(block, pattern) 
-                                 for block in code_blocks 
-                                 for pattern in self.ATTRIBUTION_PATTERNS)
-            has_license = any(self._contains_pattern(block, pattern) 
-                            for block in code_blocks 
-                            for pattern in self.LICENSE_PATTERNS)
+            blocks_attributed = has_attribution and any(self._ATTRIBUTION_RE.search(block) for block in code_blocks)
+            blocks_licensed = has_license and any(self._LICENSE_RE.search(block) for block in code_blocks)
             
-            if not has_attribution and not has_license:
+            if not blocks_attributed and not blocks_licensed:
                 self._add_finding(
                     description=f"Code blocks without attribution or license ({len(code_blocks)} blocks)",
                     severity=RiskLevel.HIGH,
@@ -145,25 +181,21 @@ class IntellectualPropertyModule(TC260BaseModule):
                 )
         
         # Check for long verbatim quotes
-        long_quotes = self._extract_matches(content, r'"[^"]{100,}"')
-        if long_quotes:
-            has_citation = any(self._contains_pattern(content, pattern) 
-                             for pattern in self.ATTRIBUTION_PATTERNS)
-            
-            if not has_citation:
+        # Only the count is used, so the quoted passages are not copied out
+        long_quote_count = sum(1 for _ in self._LONG_QUOTE_RE.finditer(content))
+        if long_quote_count:
+            if not has_attribution:
                 self._add_finding(
-                    description=f"Long quoted passages without citation ({len(long_quotes)} quotes)",
+                    description=f"Long quoted passages without citation ({long_quote_count} quotes)",
                     severity=RiskLevel.HIGH,
-                    evidence=f"{len(long_quotes)} long quotes without attribution",
+                    evidence=f"{long_quote_count} long quotes without attribution",
                     confidence=0.75
                 )
         
         # Check for book/article structure (potential plagiarism)
-        has_chapters = self._contains_pattern(content, r'(?:chapter|section)\s+\d+')
-        has_pages = self._contains_pattern(content, r'(?:page|p\.)\s+\d+')
+        has_structure = self._STRUCTURE_RE.search(content) is not None
         
-        if (has_chapters or has_pages) and not any(self._contains_pattern(content, pattern) 
-                                                   for pattern in self.ATTRIBUTION_PATTERNS):
+        if has_structure and not has_attribution:
             self._add_finding(
                 description="Structured content (chapters/pages) without source attribution",
                 severity=RiskLevel.HIGH,
@@ -172,30 +204,17 @@ class IntellectualPropertyModule(TC260BaseModule):
             )
         
         # Check for trade secret language
-        trade_secret_patterns = [
-            r'\bconfidential.*information\b',
-            r'\btrade secret\b',
-            r'\bproprietary.*(?:information|data|technology)\b',
-            r'\bnon-disclosure\b',
-        ]
-        for pattern in trade_secret_patterns:
-            if self._contains_pattern(content, pattern):
-                matches = self._extract_matches(content, pattern)
+        for match in self._TRADE_SECRET_SCANNER.scan(content)['trade_secret']:
+            if match:
                 self._add_finding(
                     description="Trade secret or confidential information language detected",
                     severity=RiskLevel.CRITICAL,
-                    evidence=str(matches[0]) if matches else None,
+                    evidence=match.group(0),
                     confidence=0.80
                 )
         
-        # Check for proper attribution
-        has_attribution = any(self._contains_pattern(content, pattern) 
-                            for pattern in self.ATTRIBUTION_PATTERNS)
-        has_license = any(self._contains_pattern(content, pattern) 
-                        for pattern in self.LICENSE_PATTERNS)
-        
         # If content appears to be from external sources but lacks attribution
-        external_indicators = len(copyright_matches) + len(long_quotes) + (1 if code_blocks else 0)
+        external_indicators = copyright_count + long_quote_count + (1 if code_blocks else 0)
         if external_indicators > 0 and not has_attribution:
             self._add_finding(
                 description="Content appears to be from external sources but lacks proper attribution",
@@ -204,7 +223,7 @@ class IntellectualPropertyModule(TC260BaseModule):
                 confidence=0.70
             )
         
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000 if self.collect_timing else 0
         
         return self._create_assessment(
             content=content,
@@ -215,7 +234,7 @@ class IntellectualPropertyModule(TC260BaseModule):
                 'has_attribution': has_attribution,
                 'has_license': has_license,
                 'code_blocks_found': len(code_blocks),
-                'copyright_notices': len(copyright_matches)
+                'copyright_notices': copyright_count
             }
         )
     
@@ -224,21 +243,13 @@ class IntellectualPropertyModule(TC260BaseModule):
         if not findings:
             return 0.0
         
-        severity_weights = {
-            RiskLevel.LOW: 15,
-            RiskLevel.MEDIUM: 40,
-            RiskLevel.HIGH: 70,
-            RiskLevel.CRITICAL: 90
-        }
-        
         # Trade secrets are highest priority
         trade_secret_findings = [f for f in findings if 'trade secret' in f.description.lower() or 'confidential' in f.description.lower()]
         if trade_secret_findings:
             return 90.0
         
         # Calculate weighted average
-        total_score = sum(severity_weights[f.severity] * f.confidence for f in findings)
-        risk_score = total_score / max(len(findings), 1)
+        risk_score = self._weighted_severity_score(self.SEVERITY_WEIGHTS)
         
         return min(risk_score, 100.0)
     
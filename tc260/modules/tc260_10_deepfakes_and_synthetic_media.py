@@ -7,42 +7,58 @@ Detects deepfakes, synthetic media, and identity fraud
 
 import time
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet
 
-from tc260.base_module import TC260BaseModule
+from tc260.base_module import TC260BaseModule, cached_analysis
+from tc260.scanner import SubstringSet, lowercase
 from tc260.schemas import RiskFinding, RiskLevel, RiskAssessment
 
 
 class DeepfakesSyntheticMediaModule(TC260BaseModule):
     """Deepfakes and Synthetic Media detection module"""
     
+    # Score weight per finding severity: LOW, MEDIUM, HIGH, CRITICAL
+    SEVERITY_WEIGHTS = (10.0, 30.0, 60.0, 90.0)
+    
     def __init__(self, threshold: float = 70.0):
         super().__init__(
             category_id="TC260-10",
             category_name="Deepfakes and Synthetic Media",
             threshold=threshold
         )
+        self.keyword_set = SubstringSet(self._get_risk_keywords())
+        self._keyword_descriptions = {
+            keyword: f"Detected deepfakes and synthetic media-related content: '{keyword}'"
+            for keyword in self.keyword_set.keywords
+        }
     
-    def analyze(self, content: str, context: Optional[Dict[str, Any]] = None) -> RiskAssessment:
+    @cached_analysis
+    def analyze(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+        precomputed_keywords: Optional[FrozenSet[str]] = None
+    ) -> RiskAssessment:
         """Analyze content for deepfakes and synthetic media risks"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns() if self.collect_timing else 0
         self._reset_findings()
         
-        content_lower = content.lower()
-        
         # Basic pattern detection (placeholder - expand with specific patterns)
-        risk_keywords = self._get_risk_keywords()
+        risk_keywords = self.keyword_set.keywords
+        present = precomputed_keywords
+        if present is None:
+            present = self.keyword_set.find_present(lowercase(content))
         
         for keyword in risk_keywords:
-            if keyword in content_lower:
+            if keyword in present:
                 self._add_finding(
-                    description=f"Detected deepfakes and synthetic media-related content: '{keyword}'",
+                    description=self._keyword_descriptions[keyword],
                     severity=RiskLevel.MEDIUM,
                     evidence=keyword,
                     confidence=0.70
                 )
         
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000 if self.collect_timing else 0
         
         return self._create_assessment(
             content=content,
@@ -62,15 +78,7 @@ class DeepfakesSyntheticMediaModule(TC260BaseModule):
         if not findings:
             return 0.0
         
-        severity_weights = {
-            RiskLevel.LOW: 10,
-            RiskLevel.MEDIUM: 30,
-            RiskLevel.HIGH: 60,
-            RiskLevel.CRITICAL: 90
-        }
-        
-        total_score = sum(severity_weights[f.severity] * f.confidence for f in findings)
-        risk_score = min(total_score / len(findings), 100.0)
+        risk_score = min(self._weighted_severity_score(self.SEVERITY_WEIGHTS), 100.0)
         
         return risk_score
     
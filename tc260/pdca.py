@@ -3,7 +3,8 @@ PDCA Cycle - Plan-Do-Check-Act (Japanese Framework)
 Continuous improvement framework for AI safety governance.
 """
 
-from typing import Dict, Any, List, Optional
+import time
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -16,6 +17,10 @@ class PDCAPhase(str, Enum):
     ACT = "ACT"
 
 
+# Phases that a review moves forward to CHECK
+_PRE_CHECK_PHASES = frozenset({PDCAPhase.PLAN, PDCAPhase.DO})
+
+
 class PDCACycle:
     """
     PDCA (Plan-Do-Check-Act) cycle implementation for AI safety.
@@ -26,10 +31,36 @@ class PDCACycle:
     ACT: Implement improvements and corrective actions
     """
     
-    def __init__(self, db_session=None):
-        """Initialize PDCA cycle"""
+    def __init__(
+        self,
+        db_session=None,
+        max_cycles: int = 10_000,
+        on_evict: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize PDCA cycle.
+        
+        Args:
+            db_session: Optional database session
+            max_cycles: Number of cycles kept in memory; beyond it, completed
+                cycles are evicted, longest-completed first
+            on_evict: Optional callback receiving each evicted cycle record,
+                e.g. to persist it
+        """
         self.db = db_session
         self.cycles = {}
+        self.max_cycles = max_cycles
+        self.on_evict = on_evict
+        # Completed cycle IDs, in completion order
+        self._completed: Dict[str, None] = {}
+        # Cycle IDs per user, in creation order
+        self._cycles_by_user: Dict[str, Dict[str, None]] = {}
+        # Last status summary per cycle, dropped whenever the cycle changes
+        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        # Running outcome counts per cycle, kept out of the public cycle record
+        self._tallies: Dict[str, Dict[str, int]] = {}
+        # Actions per cycle by action ID
+        self._actions_by_id: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def create_cycle(
         self,
@@ -50,7 +81,8 @@ class PDCACycle:
         Returns:
             PDCA cycle record
         """
-        cycle_id = f"pdca_{int(datetime.utcnow().timestamp() * 1000)}"
+        cycle_id = f"pdca_{time.time_ns() // 1_000_000}"
+        now = datetime.utcnow().isoformat()
         
         cycle = {
             "cycle_id": cycle_id,
@@ -59,8 +91,8 @@ class PDCACycle:
             "phase": PDCAPhase.PLAN,
             "frameworks": frameworks,
             "risk_threshold": risk_threshold,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "plan": {
                 "objectives": [],
                 "policies": [],
@@ -81,7 +113,30 @@ class PDCACycle:
             }
         }
         
+        # IDs are millisecond timestamps, so a new cycle can replace an existing one
+        replaced = self.cycles.get(cycle_id)
+        if replaced is not None:
+            self._cycles_by_user[replaced["user_id"]].pop(cycle_id, None)
+            self._status_cache.pop(cycle_id, None)
+            self._completed.pop(cycle_id, None)
+        
         self.cycles[cycle_id] = cycle
+        self._cycles_by_user.setdefault(user_id, {})[cycle_id] = None
+        self._tallies[cycle_id] = {
+            "passed": 0,
+            "failed": 0,
+            "accurate": 0,
+            "pending": 0,
+            "completed": 0
+        }
+        self._actions_by_id[cycle_id] = {}
+        
+        # Bound memory by evicting completed cycles; in-progress ones are kept
+        while len(self.cycles) > self.max_cycles and self._completed:
+            evicted = self._forget(next(iter(self._completed)))
+            if self.on_evict:
+                self.on_evict(evicted)
+        
         return cycle
     
     def add_objective(self, cycle_id: str, objective: str) -> Dict[str, Any]:
@@ -97,11 +152,13 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
+        now = datetime.utcnow().isoformat()
+        
         cycle["plan"]["objectives"].append({
             "objective": objective,
-            "added_at": datetime.utcnow().isoformat()
+            "added_at": now
         })
-        cycle["updated_at"] = datetime.utcnow().isoformat()
+        self._touch(cycle, now)
         
         return cycle
     
@@ -118,11 +175,13 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
+        now = datetime.utcnow().isoformat()
+        
         cycle["plan"]["policies"].append({
             "policy": policy,
-            "added_at": datetime.utcnow().isoformat()
+            "added_at": now
         })
-        cycle["updated_at"] = datetime.utcnow().isoformat()
+        self._touch(cycle, now)
         
         return cycle
     
@@ -147,20 +206,25 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
+        now = datetime.utcnow().isoformat()
+        
         # Move to DO phase if still in PLAN
         if cycle["phase"] == PDCAPhase.PLAN:
             cycle["phase"] = PDCAPhase.DO
         
         # Record verification
+        overall_vote = verification_result.get("overall_vote")
+        passed = overall_vote == "PASS"
         cycle["do"]["verifications"].append({
             "verification_id": verification_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "overall_vote": verification_result.get("overall_vote"),
+            "timestamp": now,
+            "overall_vote": overall_vote,
             "overall_risk_score": verification_result.get("overall_risk_score"),
-            "passed": verification_result.get("overall_vote") == "PASS"
+            "passed": passed
         })
         cycle["do"]["total_verifications"] += 1
-        cycle["updated_at"] = datetime.utcnow().isoformat()
+        self._tallies[cycle_id]["passed" if passed else "failed"] += 1
+        self._touch(cycle, now)
         
         return cycle
     
@@ -189,8 +253,10 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
+        now = datetime.utcnow().isoformat()
+        
         # Move to CHECK phase
-        if cycle["phase"] in [PDCAPhase.PLAN, PDCAPhase.DO]:
+        if cycle["phase"] in _PRE_CHECK_PHASES:
             cycle["phase"] = PDCAPhase.CHECK
         
         # Record review
@@ -199,20 +265,22 @@ class PDCACycle:
             "verification_id": verification_id,
             "is_accurate": is_accurate,
             "notes": notes,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }
-        cycle["check"]["reviews"].append(review)
+        check = cycle["check"]
+        check["reviews"].append(review)
         
-        # Update accuracy
-        total_reviews = len(cycle["check"]["reviews"])
-        accurate_reviews = sum(1 for r in cycle["check"]["reviews"] if r["is_accurate"])
-        cycle["check"]["accuracy"] = accurate_reviews / total_reviews if total_reviews > 0 else 0.0
+        # Update accuracy from the running count of accurate reviews
+        tallies = self._tallies[cycle_id]
+        if is_accurate:
+            tallies["accurate"] += 1
+        check["accuracy"] = tallies["accurate"] / len(check["reviews"])
         
         # Count issues
         if not is_accurate:
             cycle["check"]["issues_found"] += 1
         
-        cycle["updated_at"] = datetime.utcnow().isoformat()
+        self._touch(cycle, now)
         
         return cycle
     
@@ -239,21 +307,26 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
+        now = datetime.utcnow().isoformat()
+        
         # Move to ACT phase
         cycle["phase"] = PDCAPhase.ACT
         
         # Record action
         action = {
-            "action_id": f"act_{int(datetime.utcnow().timestamp() * 1000)}",
+            "action_id": f"act_{time.time_ns() // 1_000_000}",
             "action_type": action_type,
             "description": description,
             "assigned_to": assigned_to,
             "status": "PENDING",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now,
             "completed_at": None
         }
         cycle["act"]["actions"].append(action)
-        cycle["updated_at"] = datetime.utcnow().isoformat()
+        # IDs are millisecond timestamps; like a scan of the list, lookups find the first
+        self._actions_by_id[cycle_id].setdefault(action["action_id"], action)
+        self._tallies[cycle_id]["pending"] += 1
+        self._touch(cycle, now)
         
         return cycle
     
@@ -268,25 +341,26 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
+        now = datetime.utcnow().isoformat()
+        
         # Find and update action
-        for action in cycle["act"]["actions"]:
-            if action["action_id"] == action_id:
-                action["status"] = "COMPLETED"
-                action["completed_at"] = datetime.utcnow().isoformat()
-                break
+        tallies = self._tallies[cycle_id]
+        action = self._actions_by_id[cycle_id].get(action_id)
+        if action:
+            if action["status"] != "COMPLETED":
+                tallies["pending"] -= 1
+                tallies["completed"] += 1
+            action["status"] = "COMPLETED"
+            action["completed_at"] = now
         
-        cycle["updated_at"] = datetime.utcnow().isoformat()
+        self._touch(cycle, now)
         
         # Check if all actions are completed
-        all_completed = all(
-            action["status"] == "COMPLETED"
-            for action in cycle["act"]["actions"]
-        )
-        
-        if all_completed and cycle["act"]["actions"]:
+        if tallies["pending"] == 0 and cycle["act"]["actions"]:
             # Cycle complete - can start a new cycle
             cycle["status"] = "COMPLETED"
-            cycle["completed_at"] = datetime.utcnow().isoformat()
+            cycle["completed_at"] = now
+            self._completed.setdefault(cycle_id, None)
         
         return cycle
     
@@ -301,7 +375,12 @@ class PDCACycle:
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
         
-        return {
+        status = self._status_cache.get(cycle_id)
+        if status is not None:
+            return self._copy_status(status)
+        
+        tallies = self._tallies[cycle_id]
+        status = {
             "cycle_id": cycle_id,
             "project_name": cycle["project_name"],
             "current_phase": cycle["phase"],
@@ -313,8 +392,8 @@ class PDCACycle:
             },
             "do": {
                 "total_verifications": cycle["do"]["total_verifications"],
-                "passed": sum(1 for v in cycle["do"]["verifications"] if v["passed"]),
-                "failed": sum(1 for v in cycle["do"]["verifications"] if not v["passed"])
+                "passed": tallies["passed"],
+                "failed": tallies["failed"]
             },
             "check": {
                 "total_reviews": len(cycle["check"]["reviews"]),
@@ -323,11 +402,13 @@ class PDCACycle:
             },
             "act": {
                 "total_actions": len(cycle["act"]["actions"]),
-                "pending_actions": sum(1 for a in cycle["act"]["actions"] if a["status"] == "PENDING"),
-                "completed_actions": sum(1 for a in cycle["act"]["actions"] if a["status"] == "COMPLETED")
+                "pending_actions": tallies["pending"],
+                "completed_actions": tallies["completed"]
             },
             "status": cycle.get("status", "IN_PROGRESS")
         }
+        self._status_cache[cycle_id] = status
+        return self._copy_status(status)
     
     def get_all_cycles(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -336,9 +417,29 @@ class PDCACycle:
         Returns:
             List of cycle status summaries
         """
-        cycles = list(self.cycles.values())
-        
         if user_id:
-            cycles = [c for c in cycles if c["user_id"] == user_id]
+            cycle_ids = list(self._cycles_by_user.get(user_id, ()))
+        else:
+            cycle_ids = list(self.cycles)
         
-        return [self.get_cycle_status(c["cycle_id"]) for c in cycles]
+        return [self.get_cycle_status(cycle_id) for cycle_id in cycle_ids]
+    
+    def _copy_status(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a cached status summary, so callers cannot change the cache"""
+        # Summaries only nest one level of dicts of plain values
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in status.items()}
+    
+    def _touch(self, cycle: Dict[str, Any], now: str):
+        """Mark a cycle as updated at now and drop its cached status"""
+        cycle["updated_at"] = now
+        self._status_cache.pop(cycle["cycle_id"], None)
+    
+    def _forget(self, cycle_id: str) -> Dict[str, Any]:
+        """Remove a cycle and its index entries, returning its record"""
+        cycle = self.cycles.pop(cycle_id)
+        self._cycles_by_user[cycle["user_id"]].pop(cycle_id, None)
+        self._status_cache.pop(cycle_id, None)
+        self._completed.pop(cycle_id, None)
+        self._tallies.pop(cycle_id, None)
+        self._actions_by_id.pop(cycle_id, None)
+        return cycle
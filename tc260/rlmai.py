@@ -6,11 +6,24 @@ Continuous improvement system that learns from human feedback.
 import os
 import time
 import json
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime
 from enum import Enum
 
 
+# Training job statuses counted as active
+ACTIVE_JOB_STATUSES = ("PENDING", "TRAINING")
+
+
+@lru_cache(maxsize=1)
+def _category_ids() -> Tuple[str, ...]:
+    """TC260 category IDs of the Council of 32 (imported on first use, not at module load)"""
+    from tc260.council import CouncilOf32
+    return tuple(CouncilOf32.RISK_CATEGORIES.keys())
+
+
 class FeedbackType(str, Enum):
     """Types of human feedback"""
     CORRECT = "CORRECT"  # AI was right
@@ -30,6 +43,12 @@ class RLMAIFeedback:
         """Initialize RLMAI feedback system"""
         self.db = db_session
         self.feedback_log = []
+        # Running feedback counts per category, kept in step with feedback_log
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"total": 0, "correct": 0, "false_positives": 0, "false_negatives": 0}
+        )
+        # Feedback with a corrected vote, per category, in recording order
+        self._training_by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     
     def record_feedback(
         self,
@@ -57,7 +76,7 @@ class RLMAIFeedback:
             Feedback record
         """
         feedback = {
-            "feedback_id": f"fb_{int(time.time() * 1000)}",
+            "feedback_id": f"fb_{time.time_ns() // 1_000_000}",
             "verification_id": verification_id,
             "category_id": category_id,
             "feedback_type": feedback_type,
@@ -75,6 +94,18 @@ class RLMAIFeedback:
             # Fallback to in-memory storage
             self.feedback_log.append(feedback)
         
+        counts = self._counts[category_id]
+        counts["total"] += 1
+        if feedback_type == FeedbackType.CORRECT:
+            counts["correct"] += 1
+        elif feedback_type == FeedbackType.FALSE_POSITIVE:
+            counts["false_positives"] += 1
+        elif feedback_type == FeedbackType.FALSE_NEGATIVE:
+            counts["false_negatives"] += 1
+        
+        if corrected_vote:
+            self._training_by_category[category_id].append(feedback)
+        
         return feedback
     
     def get_feedback_stats(self, category_id: Optional[str] = None) -> Dict[str, Any]:
@@ -92,6 +123,15 @@ class RLMAIFeedback:
         else:
             return self._get_stats_from_memory(category_id)
     
+    def categories_with_feedback(self) -> FrozenSet[str]:
+        """
+        Get the categories that have received any feedback.
+        
+        Returns:
+            Category IDs with at least one feedback record
+        """
+        return frozenset(category_id for category_id, counts in self._counts.items() if counts["total"])
+    
     def get_training_data(self, category_id: str, limit: int = 1000) -> List[Dict[str, Any]]:
         """
         Get training data for fine-tuning AI models.
@@ -121,12 +161,15 @@ class RLMAIFeedback:
     
     def _get_stats_from_memory(self, category_id: Optional[str]) -> Dict[str, Any]:
         """Get stats from in-memory storage"""
-        feedback_list = self.feedback_log
-        
         if category_id:
-            feedback_list = [f for f in feedback_list if f["category_id"] == category_id]
+            counts = self._counts.get(category_id)
+        else:
+            counts = {"total": 0, "correct": 0, "false_positives": 0, "false_negatives": 0}
+            for category_counts in self._counts.values():
+                for key, value in category_counts.items():
+                    counts[key] += value
         
-        if not feedback_list:
+        if not counts or not counts["total"]:
             return {
                 "total_feedback": 0,
                 "accuracy": 0.0,
@@ -134,10 +177,10 @@ class RLMAIFeedback:
                 "false_negative_rate": 0.0
             }
         
-        total = len(feedback_list)
-        correct = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.CORRECT)
-        false_positives = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.FALSE_POSITIVE)
-        false_negatives = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.FALSE_NEGATIVE)
+        total = counts["total"]
+        correct = counts["correct"]
+        false_positives = counts["false_positives"]
+        false_negatives = counts["false_negatives"]
         
         return {
             "total_feedback": total,
@@ -154,11 +197,7 @@ class RLMAIFeedback:
     
     def _get_training_data_from_memory(self, category_id: str, limit: int) -> List[Dict[str, Any]]:
         """Get training data from in-memory storage"""
-        # Filter feedback for this category
-        category_feedback = [
-            f for f in self.feedback_log 
-            if f["category_id"] == category_id and f["corrected_vote"]
-        ]
+        category_feedback = self._training_by_category.get(category_id, [])
         
         # Return most recent examples
         return category_feedback[-limit:]
@@ -174,6 +213,13 @@ class RLMAITrainer:
         """Initialize RLMAI trainer"""
         self.api_key = gemini_api_key
         self.training_jobs = {}
+        # IDs of jobs whose status is in ACTIVE_JOB_STATUSES
+        self._active_job_ids: Set[str] = set()
+    
+    @property
+    def active_jobs(self) -> int:
+        """Number of pending or training jobs"""
+        return len(self._active_job_ids)
     
     def create_training_job(
         self,
@@ -199,15 +245,12 @@ class RLMAITrainer:
                 "category_id": category_id
             }
         
-        # Format training data for Gemini
-        formatted_data = self._format_training_data(training_data)
-        
         # Create training job
         job = {
             "job_id": f"train_{category_id}_{int(time.time())}",
             "category_id": category_id,
             "base_model": base_model,
-            "training_examples": len(formatted_data),
+            "training_examples": len(training_data),
             "status": "PENDING",
             "created_at": datetime.utcnow().isoformat()
         }
@@ -217,6 +260,7 @@ class RLMAITrainer:
         # TODO: Actually call Gemini fine-tuning API
         # For now, simulate training
         job["status"] = "TRAINING"
+        self._active_job_ids.add(job["job_id"])
         
         return job
     
@@ -224,22 +268,25 @@ class RLMAITrainer:
         """Get status of a training job"""
         return self.training_jobs.get(job_id)
     
-    def _format_training_data(self, training_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Format training data for Gemini fine-tuning"""
-        formatted = []
-        
-        for example in training_data:
-            # Extract content and corrected labels
-            formatted.append({
-                "input": example.get("content", ""),
-                "output": {
-                    "vote": example.get("corrected_vote"),
-                    "risk_score": example.get("corrected_risk_score"),
-                    "reasoning": example.get("notes", "")
-                }
-            })
-        
-        return formatted
+    def mark_job_done(self, job_id: str, status: str = "COMPLETED") -> Optional[Dict[str, Any]]:
+        """
+        Record that a training job has finished.
+        
+        Args:
+            job_id: Training job ID
+            status: Final status (e.g. "COMPLETED" or "FAILED")
+        
+        Returns:
+            Updated job, or None if the job is unknown
+        """
+        job = self.training_jobs.get(job_id)
+        if job is None:
+            return None
+        
+        job["status"] = status
+        if status not in ACTIVE_JOB_STATUSES:
+            self._active_job_ids.discard(job_id)
+        return job
 
 
 class RLMAISystem:
@@ -306,27 +353,23 @@ class RLMAISystem:
             "active_training_jobs": 0
         }
         
-        # Get stats for each category
-        from tc260.council import CouncilOf32
-        categories = list(CouncilOf32.RISK_CATEGORIES.keys())
-        
         total_accuracy = 0.0
         categories_with_feedback = 0
         
-        for category_id in categories:
+        # Get stats for each category that has feedback
+        with_feedback = self.feedback.categories_with_feedback()
+        for category_id in _category_ids():
+            if category_id not in with_feedback:
+                continue
             stats = self.feedback.get_feedback_stats(category_id)
-            if stats["total_feedback"] > 0:
-                report["categories"][category_id] = stats
-                total_accuracy += stats["accuracy"]
-                categories_with_feedback += 1
+            report["categories"][category_id] = stats
+            total_accuracy += stats["accuracy"]
+            categories_with_feedback += 1
         
         if categories_with_feedback > 0:
             report["overall_accuracy"] = total_accuracy / categories_with_feedback
         
         # Count active training jobs
-        report["active_training_jobs"] = sum(
-            1 for job in self.trainer.training_jobs.values()
-            if job["status"] in ["PENDING", "TRAINING"]
-        )
+        report["active_training_jobs"] = self.trainer.active_jobs
         
         return report
@@ -0,0 +1,309 @@
+"""
+Shared Pattern Scanning for TC260 Modules
+Council of AI - Safety Verification Platform
+
+Modules that report the first match of each of their regex patterns can
+describe them as named pattern groups. A scanner compiles the union of all
+patterns once and uses it to find the leftmost position where any pattern
+matches. Clean content (the common case) costs a single pass, and per-pattern
+searches only start from that position.
+
+Plain keyword lists are checked with SubstringSet, which uses the C
+library's memmem on long content.
+"""
+
+import ctypes
+import ctypes.util
+import re
+from functools import lru_cache
+from re import Match, Pattern
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+# First match of each pattern in a group, aligned with the group's patterns
+GroupHits = Dict[str, List[Optional[Match]]]
+
+# libc memmem, when the platform provides it
+try:
+    _memmem = ctypes.CDLL(ctypes.util.find_library('c')).memmem
+    _memmem.restype = ctypes.c_void_p
+    _memmem.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t]
+except (OSError, AttributeError, TypeError):
+    _memmem = None
+
+
+def _split_group(pattern: str, start: int) -> Optional[Tuple[List[str], str]]:
+    """Split a leading group whose body begins at start into its top-level alternatives and the rest"""
+    depth = 0
+    alternatives = []
+    i = start
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            return None
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            if depth == 0:
+                alternatives.append(pattern[start:i])
+                return alternatives, pattern[i + 1:]
+            depth -= 1
+        elif char == '|' and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    return None
+
+
+def _top_level_branches(pattern: str) -> List[str]:
+    """
+    Split pattern at its top-level '|' into the branches of its alternation.
+    
+    A '\\b' at the start of a pattern only binds to its first branch, so
+    r'\\bfoo|bar' must be handled as the two branches r'\\bfoo' and 'bar'.
+    """
+    branches = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            # A ']' right after '[' or '[^' is a literal, not the end of the class
+            if pattern[i + 1:i + 2] == '^':
+                i += 1
+            if pattern[i + 1:i + 2] == ']':
+                i += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def _leading_chars(pattern: str) -> Optional[Set[str]]:
+    """
+    Characters a match of pattern can start with, if they are plain literals.
+    
+    Only understands leading letters/digits and plain or non-capturing groups
+    of such alternatives; anything else returns None.
+    """
+    if pattern.startswith('(?:'):
+        body_start = 3
+    elif pattern.startswith('(') and not pattern.startswith('(?'):
+        body_start = 1
+    else:
+        body_start = 0
+    if body_start:
+        split = _split_group(pattern, body_start)
+        if split is None:
+            return None
+        alternatives, rest = split
+        if rest[:1] in ('?', '*', '{'):
+            return None
+        chars: Set[str] = set()
+        for alternative in alternatives:
+            alternative_chars = _leading_chars(alternative or rest)
+            if alternative_chars is None:
+                return None
+            chars |= alternative_chars
+        return chars
+    if pattern[:1].isalnum() and pattern[1:2] not in ('?', '*', '{'):
+        return {pattern[0]}
+    return None
+
+
+def _factor_boundary(tails: Sequence[str]) -> str:
+    """Alternation of r'\\b' + tail for each tail, with the boundary factored out"""
+    body = '|'.join(f'(?:{t})' for t in tails)
+    chars: Set[str] = set()
+    for tail in tails:
+        tail_chars = _leading_chars(tail)
+        if tail_chars is None:
+            return rf'\b(?:{body})'
+        chars |= tail_chars
+    first = ''.join(re.escape(c) for c in sorted(chars))
+    return rf'\b(?=[{first}])(?:{body})'
+
+
+def compile_alternation(patterns: Sequence[str], flags: int = 0) -> Pattern:
+    """
+    Compile patterns into one alternation that matches exactly like
+    '|'.join(patterns).
+    
+    The re engine tries every alternative at every position. Each run of
+    consecutive top-level branches that start with a word boundary has it
+    factored out and followed by a lookahead on the possible first
+    characters, so most positions are rejected before any of them runs.
+    Branches keep their order, so the same branch wins at every position.
+    """
+    parts = []
+    run: List[str] = []
+    for p in patterns:
+        for branch in _top_level_branches(p):
+            if branch.startswith(r'\b'):
+                run.append(branch[2:])
+                continue
+            if run:
+                parts.append(_factor_boundary(run))
+                run = []
+            parts.append(f'(?:{branch})')
+    if run:
+        parts.append(_factor_boundary(run))
+    return re.compile('|'.join(parts), flags)
+
+
+def _compile_union(patterns: Sequence[Pattern]) -> Optional[Pattern]:
+    """Compile an alternation of all patterns (they must share the same flags)"""
+    if not patterns:
+        return None
+    flags = patterns[0].flags
+    if any(p.flags != flags for p in patterns):
+        raise ValueError("All patterns of a scanner must be compiled with the same flags")
+    return compile_alternation([p.pattern for p in patterns], flags)
+
+
+class PatternScanner:
+    """
+    First-match scanner over named groups of compiled patterns.
+    
+    Since no pattern can match before the union's leftmost match, searching
+    each pattern from that position gives the same result as searching the
+    whole content.
+    """
+    
+    def __init__(self, groups: Dict[str, Sequence[Pattern]]):
+        """
+        Args:
+            groups: Group name -> compiled patterns, in reporting order
+        """
+        self.groups = {name: tuple(patterns) for name, patterns in groups.items()}
+        self.patterns = tuple(p for patterns in self.groups.values() for p in patterns)
+        self._union = _compile_union(self.patterns)
+    
+    def empty_hits(self) -> GroupHits:
+        """Hits for content where no pattern matches"""
+        return {name: [None] * len(patterns) for name, patterns in self.groups.items()}
+    
+    def scan(self, content: str, pos: int = 0) -> GroupHits:
+        """
+        Find the first match of every pattern.
+        
+        Args:
+            content: Content to scan
+            pos: Position known to precede any match
+        
+        Returns:
+            Group name -> first match (or None) per pattern
+        """
+        first = self._union.search(content, pos) if self._union else None
+        if first is None:
+            return self.empty_hits()
+        start = first.start()
+        return {
+            name: [pattern.search(content, start) for pattern in patterns]
+            for name, patterns in self.groups.items()
+        }
+
+
+class SharedScanner:
+    """
+    Scans content once on behalf of several modules.
+    
+    The union of every module's patterns gates all of them: when nothing
+    matches, each module gets empty hits without running its own scan.
+    """
+    
+    def __init__(self, scanners: Dict[str, PatternScanner]):
+        """
+        Args:
+            scanners: Module category ID -> that module's PatternScanner
+        """
+        self.scanners = dict(scanners)
+        self._union = _compile_union([p for s in self.scanners.values() for p in s.patterns])
+    
+    def scan(self, content: str) -> Dict[str, GroupHits]:
+        """
+        Scan content for all modules.
+        
+        Returns:
+            Module category ID -> hits, to pass as precomputed_hits
+        """
+        first = self._union.search(content) if self._union else None
+        if first is None:
+            return {category_id: s.empty_hits() for category_id, s in self.scanners.items()}
+        start = first.start()
+        return {category_id: s.scan(content, start) for category_id, s in self.scanners.items()}
+
+
+@lru_cache(maxsize=4)
+def lowercase(content: str) -> str:
+    """
+    content.lower(), computed once per content.
+    
+    Every module of a verification request receives the same string, so
+    keyword checks across modules and threads share one lowercased copy.
+    """
+    return content.lower()
+
+
+class SubstringSet:
+    """
+    Fixed set of literal keywords checked for presence in content.
+    
+    str's own search is used for short content. Above MEMMEM_MIN_LENGTH the
+    content is encoded once and each keyword is found with memmem, which
+    compares many bytes at a time; UTF-8 keeps substring matches identical.
+    """
+    
+    # Below this many characters the encode and foreign calls cost more than they save
+    MEMMEM_MIN_LENGTH = 4096
+    
+    def __init__(self, keywords: Sequence[str]):
+        """
+        Args:
+            keywords: Keywords to look for
+        """
+        self.keywords = tuple(keywords)
+        self._encoded = tuple(k.encode('utf-8') for k in self.keywords)
+    
+    def find_present(self, content: str) -> FrozenSet[str]:
+        """
+        Find which keywords occur in content.
+        
+        Returns:
+            The keywords found
+        """
+        if _memmem is None or len(content) < self.MEMMEM_MIN_LENGTH:
+            return frozenset(keyword for keyword in self.keywords if keyword in content)
+        data = content.encode('utf-8', 'surrogatepass')
+        size = len(data)
+        return frozenset(
+            keyword
+            for keyword, encoded in zip(self.keywords, self._encoded)
+            if _memmem(data, size, encoded, len(encoded)) is not None
+        )
+    
+    def count_present(self, content: str) -> int:
+        """
+        Count how many keywords occur in content.
+        
+        Returns:
+            Number of distinct keywords found
+        """
+        return len(self.find_present(content))
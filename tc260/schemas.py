@@ -3,12 +3,16 @@ TC260 Pydantic Schemas for Risk Assessment
 Council of AI - Safety Verification Platform
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
 
+# Identifiers of all 32 TC260 risk categories
+_ALL_CATEGORY_IDS = tuple(f"TC260-{i:02d}" for i in range(1, 33))
+
+
 class RiskLevel(str, Enum):
     """Risk severity levels"""
     LOW = "LOW"
@@ -26,15 +30,30 @@ class VerificationStatus(str, Enum):
 
 class RiskFinding(BaseModel):
     """Individual risk finding within a category"""
+    # Findings and assessments are cached and shared between reports
+    model_config = ConfigDict(frozen=True)
+    
     description: str
     severity: RiskLevel
     location: Optional[str] = None  # Where in the input this was found
     evidence: Optional[str] = None  # Supporting evidence
     confidence: float = Field(ge=0.0, le=1.0)
+    
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "RiskFinding":
+        """
+        Build from values the server produced itself, skipping validation.
+        
+        Values must already have the field types and ranges; anything parsed
+        from a request goes through the normal constructor.
+        """
+        return cls.model_construct(**data)
 
 
 class RiskAssessment(BaseModel):
     """Risk assessment result for a single TC260 category"""
+    model_config = ConfigDict(frozen=True)
+    
     category_id: str = Field(..., description="TC260 category identifier (e.g., TC260-01)")
     category_name: str = Field(..., description="Human-readable category name")
     risk_score: float = Field(ge=0.0, le=100.0, description="Risk score from 0 (safe) to 100 (critical)")
@@ -46,6 +65,16 @@ class RiskAssessment(BaseModel):
     processing_time_ms: int = Field(ge=0, description="Time taken to process this category")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "RiskAssessment":
+        """
+        Build from values the server produced itself, skipping validation.
+        
+        Values must already have the field types and ranges; anything parsed
+        from a request goes through the normal constructor.
+        """
+        return cls.model_construct(**data)
 
 
 class VerificationRequest(BaseModel):
@@ -53,6 +82,7 @@ class VerificationRequest(BaseModel):
     content: str = Field(..., description="AI-generated content to verify")
     categories: Optional[List[str]] = Field(
         default=None, 
+        max_length=len(_ALL_CATEGORY_IDS),
         description="Specific TC260 categories to test (None = all)"
     )
     threshold: float = Field(
@@ -69,6 +99,21 @@ class VerificationRequest(BaseModel):
 
 class VerificationReport(BaseModel):
     """Complete verification report across all tested categories"""
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "request_id": "ver_abc123",
+            "overall_score": 35.5,
+            "overall_status": "PASS",
+            "categories_tested": 5,
+            "categories_passed": 4,
+            "categories_failed": 1,
+            "categories_warning": 0,
+            "risk_assessments": [],
+            "timestamp": "2025-12-14T17:30:00Z",
+            "processing_time_ms": 1250
+        }
+    })
+    
     request_id: str
     overall_score: float = Field(ge=0.0, le=100.0, description="Weighted average risk score")
     overall_status: VerificationStatus
@@ -80,27 +125,21 @@ class VerificationReport(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     processing_time_ms: int
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "request_id": "ver_abc123",
-                "overall_score": 35.5,
-                "overall_status": "PASS",
-                "categories_tested": 5,
-                "categories_passed": 4,
-                "categories_failed": 1,
-                "categories_warning": 0,
-                "risk_assessments": [],
-                "timestamp": "2025-12-14T17:30:00Z",
-                "processing_time_ms": 1250
-            }
-        }
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "VerificationReport":
+        """
+        Build from values the server produced itself, skipping validation.
+        
+        Values must already have the field types and ranges; anything parsed
+        from a request goes through the normal constructor.
+        """
+        return cls.model_construct(**data)
 
 
 class TC260Config(BaseModel):
     """Configuration for TC260 verification engine"""
     enabled_categories: List[str] = Field(
-        default_factory=lambda: [f"TC260-{i:02d}" for i in range(1, 33)]
+        default_factory=lambda: list(_ALL_CATEGORY_IDS)
     )
     default_threshold: float = 70.0
     parallel_processing: bool = True
@@ -108,3 +147,4 @@ class TC260Config(BaseModel):
     timeout_seconds: int = 30
     enable_caching: bool = True
     cache_ttl_seconds: int = 3600
+    collect_timing: bool = True
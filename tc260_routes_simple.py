@@ -1,33 +1,40 @@
 """
 TC260/EU260 API Routes - Simplified for testing
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 
-from tc260.engine import TC260Engine
+from tc260.engine import get_engine
 from tc260.schemas import VerificationRequest, VerificationReport
 
 router = APIRouter()
 
-# Initialize TC260 engine
-tc260_engine = TC260Engine()
+# Shared TC260 engine
+tc260_engine = get_engine()
+
+# System information is static once the engine is loaded
+TC260_INFO = {
+    "name": "TC260/EU260 Safety Verification System",
+    "version": "1.0.0",
+    "framework": "Council of AI - EU260",
+    "modules": tc260_engine.get_module_info()
+}
 
 @router.get("/tc260")
 async def tc260_info():
     """Get TC260 system information"""
-    return {
-        "name": "TC260/EU260 Safety Verification System",
-        "version": "1.0.0",
-        "framework": "Council of AI - EU260",
-        "modules": tc260_engine.get_module_info()
-    }
+    return TC260_INFO
 
-@router.post("/tc260/verify")
-async def verify_content(request: VerificationRequest) -> VerificationReport:
+@router.post("/tc260/verify", response_model=VerificationReport)
+async def verify_content(request: VerificationRequest) -> Response:
     """Verify content against TC260/EU260 safety standards"""
-    report = tc260_engine.verify(request)
-    return report
+    # Verification is CPU-bound; run it off the event loop so other requests keep being served
+    report = await run_in_threadpool(tc260_engine.verify, request)
+    # The report is built by the engine, so skip response validation and let
+    # pydantic-core encode it directly
+    return Response(content=report.model_dump_json(), media_type="application/json")
 
 @router.get("/tc260/modules")
 async def list_modules():
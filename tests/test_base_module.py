@@ -0,0 +1,42 @@
+"""
+Tests for the shared behaviour in tc260.base_module
+"""
+
+import unittest
+
+from tc260.engine import TC260Engine
+from tc260.modules.tc260_04_harmful import HarmfulContentModule
+from tc260.schemas import TC260Config
+
+# Long enough to be cached (see TC260BaseModule.CACHE_MIN_CONTENT_LENGTH)
+CONTENT = 'The report describes the quarterly results and the plans for next year in detail.'
+
+
+class AssessmentCacheTest(unittest.TestCase):
+    
+    def test_identical_content_reuses_assessment(self):
+        module = HarmfulContentModule()
+        self.assertIs(module.analyze(CONTENT), module.analyze(CONTENT))
+    
+    def test_disabled_cache_analyzes_again(self):
+        module = HarmfulContentModule()
+        module.cache_enabled = False
+        self.assertIsNot(module.analyze(CONTENT), module.analyze(CONTENT))
+    
+    def test_expired_assessment_is_not_reused(self):
+        module = HarmfulContentModule()
+        module.cache_ttl_seconds = 0
+        self.assertIsNot(module.analyze(CONTENT), module.analyze(CONTENT))
+    
+    def test_engine_config_applies_to_modules(self):
+        engine = TC260Engine(TC260Config(enable_caching=False, cache_ttl_seconds=5))
+        try:
+            for module in engine.modules.values():
+                self.assertFalse(module.cache_enabled)
+                self.assertEqual(module.cache_ttl_seconds, 5)
+        finally:
+            engine.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
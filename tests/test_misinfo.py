@@ -0,0 +1,56 @@
+"""
+Tests for the TC260-03 misinformation module
+"""
+
+import unittest
+
+from tc260.modules.tc260_03_misinfo import MisinformationModule
+from tc260.schemas import RiskLevel
+
+
+def _known_misinfo(result):
+    return [f.evidence for f in result.findings if f.description.startswith('Known misinformation')]
+
+
+class KnownMisinformationTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.module = MisinformationModule()
+    
+    def test_phrases_match_as_substrings(self):
+        cases = {
+            'Flat earthers say chemtrails are real.': ['flat earth', 'chemtrails'],
+            'qanons': ['qanon'],
+            'pizzagates': ['pizzagate'],
+            'chemtrailss': ['chemtrails'],
+            'xchemtrailsy': ['chemtrails'],
+        }
+        for content, expected in cases.items():
+            with self.subTest(content=content):
+                result = self.module.analyze(content)
+                self.assertEqual(_known_misinfo(result), expected)
+                self.assertEqual(result.severity, RiskLevel.CRITICAL)
+                self.assertEqual(result.risk_score, 95.0)
+                self.assertFalse(result.passed)
+    
+    def test_nearby_phrases_are_all_reported(self):
+        cases = {
+            'The flat earth and chemtrails and qanon stuff.': ['flat earth', 'chemtrails', 'qanon'],
+            'flat earth flat earth vaccines cause autism': ['flat earth', 'vaccines cause autism'],
+            'Claims: covid is a hoax; moon landing fake; 5g causes covid': [
+                'moon landing fake', '5g causes covid', 'covid is a hoax'
+            ],
+        }
+        for content, expected in cases.items():
+            with self.subTest(content=content):
+                self.assertEqual(_known_misinfo(self.module.analyze(content)), expected)
+    
+    def test_matches_plain_substring_check(self):
+        for content in ('FLAT EARTH', 'The Moon Landing Fake story', 'nothing here', 'qanonpizzagate'):
+            with self.subTest(content=content):
+                expected = [p for p in MisinformationModule.KNOWN_MISINFO if p in content.lower()]
+                self.assertEqual(_known_misinfo(self.module.analyze(content)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
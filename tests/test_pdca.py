@@ -0,0 +1,53 @@
+"""
+Tests for the PDCA cycle in tc260.pdca
+"""
+
+import unittest
+
+from tc260.pdca import PDCACycle
+
+
+class PDCACycleTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.pdca = PDCACycle()
+        self.cycle_id = self.pdca.create_cycle('user', 'project', ['TC260'])['cycle_id']
+    
+    def test_cycle_record_has_only_public_fields(self):
+        self.pdca.execute_verification(self.cycle_id, 'v1', {'overall_vote': 'PASS', 'overall_risk_score': 10})
+        self.pdca.add_review(self.cycle_id, 'reviewer', 'v1', True)
+        cycle = self.pdca.add_action(self.cycle_id, 'CORRECTIVE', 'Fix it')
+        self.assertEqual(set(cycle['do']), {'verifications', 'total_verifications'})
+        self.assertEqual(set(cycle['check']), {'reviews', 'accuracy', 'issues_found'})
+        self.assertEqual(set(cycle['act']), {'actions', 'improvements'})
+    
+    def test_status_counts(self):
+        self.pdca.execute_verification(self.cycle_id, 'v1', {'overall_vote': 'PASS'})
+        self.pdca.execute_verification(self.cycle_id, 'v2', {'overall_vote': 'FAIL'})
+        self.pdca.add_review(self.cycle_id, 'reviewer', 'v1', True)
+        self.pdca.add_review(self.cycle_id, 'reviewer', 'v2', False)
+        cycle = self.pdca.add_action(self.cycle_id, 'CORRECTIVE', 'Fix it')
+        action_id = cycle['act']['actions'][0]['action_id']
+        
+        status = self.pdca.get_cycle_status(self.cycle_id)
+        self.assertEqual((status['do']['passed'], status['do']['failed']), (1, 1))
+        self.assertEqual(status['check']['accuracy'], 0.5)
+        self.assertEqual((status['act']['pending_actions'], status['act']['completed_actions']), (1, 0))
+        self.assertEqual(status['status'], 'IN_PROGRESS')
+        
+        self.pdca.complete_action(self.cycle_id, action_id)
+        status = self.pdca.get_cycle_status(self.cycle_id)
+        self.assertEqual((status['act']['pending_actions'], status['act']['completed_actions']), (0, 1))
+        self.assertEqual(status['status'], 'COMPLETED')
+    
+    def test_status_changes_do_not_reach_the_cache(self):
+        status = self.pdca.get_cycle_status(self.cycle_id)
+        status['status'] = 'CHANGED'
+        status['do']['passed'] = 99
+        for status in (self.pdca.get_cycle_status(self.cycle_id), self.pdca.get_all_cycles()[0]):
+            self.assertEqual(status['status'], 'IN_PROGRESS')
+            self.assertEqual(status['do']['passed'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the shared pattern scanning in tc260.scanner
+"""
+
+import re
+import unittest
+
+from tc260.engine import TC260Engine
+from tc260.modules.tc260_04_harmful import HarmfulContentModule
+from tc260.scanner import PatternScanner, SharedScanner, compile_alternation
+from tc260.schemas import RiskLevel
+
+_WORD_RE = re.compile(r'[A-Za-z]{3,}')
+
+
+def _spans(pattern, content):
+    return [(m.span(), m.group()) for m in pattern.finditer(content)]
+
+
+def _hit(match):
+    return None if match is None else (match.span(), match.group())
+
+
+def _edge_corpus(patterns):
+    """
+    Inputs built from the words in patterns: as whole words, inside other
+    words, in different cases and next to words of other top-level branches.
+    """
+    words = sorted({w for p in patterns for w in _WORD_RE.findall(p.pattern)})
+    corpus = [
+        '',
+        'Nothing to see here.',
+        'antipedophilia groups',
+        'ANTIPEDOPHILIA',
+        ' '.join(words),
+        ''.join(words),
+    ]
+    for word in words:
+        corpus += [
+            word,
+            f'x{word}y',
+            f'anti{word}',
+            f'{word}s and more',
+            word.upper(),
+            word.swapcase(),
+            f'The {word.title()} of it, then {word}.',
+        ]
+    return corpus
+
+
+def _module_scanners():
+    """Every PatternScanner declared on a registered module class"""
+    scanners = {}
+    for category_id, module_class in TC260Engine.MODULE_REGISTRY.items():
+        for name in dir(module_class):
+            value = getattr(module_class, name)
+            if isinstance(value, PatternScanner):
+                scanners[f'{category_id}.{name}'] = value
+    return scanners
+
+
+def _module_pattern_lists():
+    """Every list of regex source strings declared on a registered module class"""
+    pattern_lists = {}
+    for category_id, module_class in TC260Engine.MODULE_REGISTRY.items():
+        for name in dir(module_class):
+            value = getattr(module_class, name)
+            candidates = value.items() if isinstance(value, dict) else [(None, value)]
+            for key, patterns in candidates:
+                if not isinstance(patterns, (list, tuple)) or not patterns:
+                    continue
+                if not all(isinstance(p, str) for p in patterns):
+                    continue
+                try:
+                    compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
+                except re.error:
+                    continue
+                label = f'{category_id}.{name}' if key is None else f'{category_id}.{name}[{key}]'
+                pattern_lists[label] = (patterns, compiled)
+    return pattern_lists
+
+
+class CompileAlternationTest(unittest.TestCase):
+    
+    def test_word_boundary_not_factored_across_top_level_alternation(self):
+        # \b only binds to the first branch of r'\bpedophile|pedophilia\b'
+        patterns = [r'\bpedophile|pedophilia\b', r'\bchild\s+abuse\b']
+        plain = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+        combined = compile_alternation(patterns, re.IGNORECASE)
+        for content in ('antipedophilia groups', 'ANTIPEDOPHILIA', 'a pedophile', 'child abuse'):
+            self.assertEqual(_spans(combined, content), _spans(plain, content), content)
+    
+    def test_antipedophilia_is_flagged(self):
+        result = HarmfulContentModule().analyze('antipedophilia groups')
+        self.assertEqual(result.severity, RiskLevel.CRITICAL)
+        self.assertTrue(any('CHILD SAFETY' in f.description for f in result.findings))
+    
+    def test_module_pattern_lists_match_plain_join(self):
+        for label, (patterns, compiled) in _module_pattern_lists().items():
+            with self.subTest(patterns=label):
+                plain = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+                combined = compile_alternation(patterns, re.IGNORECASE)
+                for content in _edge_corpus(compiled):
+                    self.assertEqual(_spans(combined, content), _spans(plain, content), content)
+
+
+class PatternScannerTest(unittest.TestCase):
+    
+    def _assert_hits_match_search(self, scanner, hits, content):
+        for name, patterns in scanner.groups.items():
+            self.assertEqual(
+                [_hit(m) for m in hits[name]],
+                [_hit(p.search(content)) for p in patterns],
+                f'{name}: {content!r}',
+            )
+    
+    def test_scan_matches_per_pattern_search(self):
+        scanners = _module_scanners()
+        self.assertTrue(scanners)
+        for scanner_name, scanner in scanners.items():
+            with self.subTest(scanner=scanner_name):
+                for content in _edge_corpus(scanner.patterns):
+                    self._assert_hits_match_search(scanner, scanner.scan(content), content)
+    
+    def test_shared_scan_matches_per_pattern_search(self):
+        # Built like the engine's shared scanner
+        shared = SharedScanner({
+            category_id: module_class.SCANNER
+            for category_id, module_class in TC260Engine.MODULE_REGISTRY.items()
+            if module_class.SCANNER is not None
+        })
+        patterns = [p for scanner in shared.scanners.values() for p in scanner.patterns]
+        for content in _edge_corpus(patterns):
+            results = shared.scan(content)
+            for category_id, scanner in shared.scanners.items():
+                self._assert_hits_match_search(scanner, results[category_id], content)
+
+
+if __name__ == '__main__':
+    unittest.main()